@@ -6,7 +6,6 @@ Adaptation of Python's console found in code.py so that it can be
 used to show some "friendly" tracebacks.
 """
 import builtins
-import copy
 import os
 import platform
 import traceback
@@ -52,9 +51,16 @@ class FriendlyConsole(InteractiveConsole):
         self.fake_filename = "<friendly-console:%d>"
         self.counter = 1
         self.old_locals = {}
-        self.saved_builtins = {}
-        for name in dir(builtins):
-            self.saved_builtins[name] = getattr(builtins, name)
+        self.saved_builtins = vars(builtins).copy()
+        self._builtin_names = frozenset(self.saved_builtins)
+        # Sorted, so that warnings are always shown in the same order.
+        self._nondunder_builtins = tuple(
+            sorted(
+                name
+                for name in self._builtin_names
+                if not (name.startswith("__") and name.endswith("__"))
+            )
+        )
         self.rich_console = False
         if friendly_rich.rich_available and use_rich:
             self.rich_console = friendly_rich.init_console(theme)
@@ -163,7 +169,7 @@ class FriendlyConsole(InteractiveConsole):
 
         self.check_for_builtins_changes()
         self.check_for_annotations()
-        self.old_locals = copy.copy(self.locals)
+        self.old_locals = self.locals.copy()
 
     def check_for_annotations(self):
         """Attempts to detect code that uses : instead of = by mistake"""
@@ -183,76 +189,79 @@ class FriendlyConsole(InteractiveConsole):
         )
         suggest_str = _("Instead of {hint}, perhaps you meant {assignment}.")
 
+        # Warnings about builtins are shown as they are found; suggestions
+        # about other names are collected and shown together afterwards.
+        suggestions = []
+        missing_value = False
+        # Local names are faster to access inside the loop.
+        builtin_names = self._builtin_names
+        local_vars = self.locals
+        old_locals = self.old_locals
+        rich_console = self.rich_console
         for name in hints:
-            warning = ""
-            if name in dir(builtins):
+            if name in builtin_names:
                 warning = warning_builtins.format(name=_quote(name))
-                if self.rich_console:
+                if rich_console:
                     warning = "#### " + warning
                     warning = friendly_rich.Markdown(warning)
-                    self.rich_console.print(warning)
-                    self.rich_console.print(please_comment)
+                    rich_console.print(warning)
+                    rich_console.print(please_comment)
                 else:
                     print(warning)
                     print(please_comment)
-
-        wrote_title = False
-        warning = ""
-
-        for name in hints:
-            if name in dir(builtins):  # Already taken care of these above
                 continue
             if (
-                name not in self.locals
-                or name in self.old_locals
-                and self.old_locals[name] == self.locals[name]
+                name not in local_vars
+                or name in old_locals
+                and old_locals[name] == local_vars[name]
             ):
-                if not wrote_title:
-                    warning = header_warning
-                    wrote_title = True
-                    if self.rich_console:
-                        warning = "#### " + warning
-                if not str(f"{hints[name]}").startswith("<"):
-                    suggest = suggest_str.format(
-                        hint=_quote(f"{name} : {hints[name]}"),
-                        assignment=_quote(f"{name} = {hints[name]}"),
-                    )
-                else:
-                    suggest = ""
-                if self.rich_console and suggest:
+                missing_value = True
+                hint = f"{hints[name]}"
+                if hint.startswith("<"):
+                    continue
+                suggest = suggest_str.format(
+                    hint=_quote(f"{name} : {hint}"),
+                    assignment=_quote(f"{name} = {hint}"),
+                )
+                if rich_console:
                     suggest = "* " + suggest
-                if suggest:
-                    warning = warning + suggest + "\n"
+                suggestions.append(suggest + "\n")
+
+        if not missing_value:
+            return
 
-        if warning:
-            if self.rich_console:
-                warning = friendly_rich.Markdown(warning)
-                self.rich_console.print(warning)
-                self.rich_console.print(please_comment)
-            else:
-                print(warning)
-                print(please_comment)
+        if self.rich_console:
+            header_warning = "#### " + header_warning
+        warning = header_warning + "".join(suggestions)
+        if self.rich_console:
+            warning = friendly_rich.Markdown(warning)
+            self.rich_console.print(warning)
+            self.rich_console.print(please_comment)
+        else:
+            print(warning)
+            print(please_comment)
 
-            self.locals["__annotations__"] = {}
+        self.locals["__annotations__"] = {}
 
     def check_for_builtins_changes(self):
         """Warning users if they assign a value to a builtin"""
         _ = current_lang.translate
         changed = []
-        for name in self.saved_builtins:
-            if name.startswith("__") and name.endswith("__"):
+        local_vars = self.locals
+        saved_builtins = self.saved_builtins
+        for name in self._nondunder_builtins:
+            if name not in local_vars:
                 continue
-
             if (
                 name == "pow"
-                and "cos" in self.locals
-                and "cosh" in self.locals
-                and "pi" in self.locals
+                and "cos" in local_vars
+                and "cosh" in local_vars
+                and "pi" in local_vars
             ):
                 # we likely did 'from math import *' which redefines pow;
                 # no warning needed in this case
                 continue
-            if name in self.locals and self.saved_builtins[name] != self.locals[name]:
+            if saved_builtins[name] != local_vars[name]:
                 warning = _(
                     "Warning: you have redefined the python builtin {name}."
                 ).format(name=_quote(name))
@@ -266,7 +275,7 @@ class FriendlyConsole(InteractiveConsole):
                 changed.append(name)
 
         for name in changed:
-            self.saved_builtins[name] = self.locals[name]
+            saved_builtins[name] = local_vars[name]
 
     # The following two methods are never used in this class, but they are
     # defined in the parent class. The following are the equivalent methods
@@ -399,6 +408,26 @@ def debug():
     explain("debug_tb")
 
 
+_CONSOLE_DEFAULTS = {
+    "explain": explain,
+    "what": what,
+    "where": where,
+    "why": why,
+    "more": more,
+    "get_lang": friendly_traceback.get_lang,
+    "set_lang": friendly_traceback.set_lang,
+    "get_include": friendly_traceback.get_include,
+    "set_include": friendly_traceback.set_include,
+    "hint": hint,
+    "friendly_tb": friendly_tb,
+    "python_tb": python_tb,
+    "debug_tb": debug_tb,
+    "debug": debug,
+    "show_paths": path_utils.show_paths,
+    "_info": _info,
+}
+
+
 def start_console(
     local_vars=None,
     use_rich=False,
@@ -408,39 +437,19 @@ def start_console(
     theme="dark",
 ):
     """Starts a console; modified from code.interact"""
-    from . import config
-
     if banner is None:
         banner = BANNER
     if theme != "light":
         theme = "dark"
     if use_rich:
-        config.session.set_formatter("rich", theme=theme)
-
-    console_defaults = {
-        "explain": explain,
-        "what": what,
-        "where": where,
-        "why": why,
-        "more": more,
-        "get_lang": friendly_traceback.get_lang,
-        "set_lang": friendly_traceback.set_lang,
-        "get_include": friendly_traceback.get_include,
-        "set_include": friendly_traceback.set_include,
-        "hint": hint,
-        "friendly_tb": friendly_tb,
-        "python_tb": python_tb,
-        "debug_tb": debug_tb,
-        "debug": debug,
-        "show_paths": path_utils.show_paths,
-        "_info": _info,
-    }
+        session.set_formatter("rich", theme=theme)
+
     if not friendly_traceback.is_installed():
         friendly_traceback.install(include=include, lang=lang)
     if local_vars is None:
-        local_vars = console_defaults
+        local_vars = _CONSOLE_DEFAULTS.copy()
     else:
-        local_vars.update(console_defaults)
+        local_vars.update(_CONSOLE_DEFAULTS)
 
     console = FriendlyConsole(locals=local_vars, use_rich=use_rich, theme=theme)
     console.interact(banner=banner)
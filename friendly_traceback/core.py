@@ -18,9 +18,9 @@ to figure out when a change is made as one can simply do a string search
 and locate a particular message, instead of attempting to follow
 function call after function call.
 """
+import functools
 import inspect
 from itertools import dropwhile
-import os
 import re
 import traceback
 
@@ -169,12 +169,29 @@ def get_records(tb, cache):
     from our own code included either at the beginning or at the
     end of the traceback.
     """
-    records = inspect.getinnerframes(tb, cache.context)
-    records = list(dropwhile(lambda record: is_excluded_file(record.filename), records))
-    records.reverse()
-    records = list(dropwhile(lambda record: is_excluded_file(record.filename), records))
-    records.reverse()
-    return records
+    # We walk the traceback ourselves instead of using
+    # inspect.getinnerframes() so that the source context, which is costly
+    # to retrieve, is only read for the frames that are kept.
+    tracebacks = []
+    while tb is not None:
+        tracebacks.append(tb)
+        tb = tb.tb_next
+    tracebacks = list(dropwhile(_is_excluded_tb, tracebacks))
+    tracebacks.reverse()
+    tracebacks = list(dropwhile(_is_excluded_tb, tracebacks))
+    tracebacks.reverse()
+    return [
+        inspect.FrameInfo(tb.tb_frame, *inspect.getframeinfo(tb, cache.context))
+        for tb in tracebacks
+    ]
+
+
+def _is_excluded_tb(tb):
+    """Determines if a traceback entry comes from an excluded file,
+    using the same filename as the one given by inspect.getframeinfo().
+    """
+    frame = tb.tb_frame
+    return is_excluded_file(inspect.getsourcefile(frame) or inspect.getfile(frame))
 
 
 def format_python_tracebacks(records, etype, value, python_tb, info):
@@ -307,8 +324,10 @@ def get_partial_source(filename, linenumber, lines, index):
     ):  # note: Something might have been cached with this name
         source = cannot_analyze_string()
         line = None
-    elif filename and os.path.abspath(filename):
-        source, line = highlight_source(linenumber, index, lines)
+    elif filename:
+        if lines is not None:
+            lines = tuple(lines)  # hashable, for the cache
+        source, line = _cached_highlight_source(linenumber, index, lines)
         if not source:
             line = "1"
             if filename == "<stdin>":
@@ -321,7 +340,7 @@ def get_partial_source(filename, linenumber, lines, index):
                 source = _("Problem: source of '{filename}' is not available\n").format(
                     filename=filename
                 )
-    elif not filename:
+    else:
         raise FileNotFoundError("Cannot find %s" % filename)
 
     if not source.endswith("\n"):
@@ -330,6 +349,14 @@ def get_partial_source(filename, linenumber, lines, index):
     return {"source": source, "line": line}
 
 
+@functools.lru_cache(maxsize=256)
+def _cached_highlight_source(linenumber, index, lines):
+    """Highlighting the same lines again, as happens when an exception
+    is raised repeatedly from the same location, returns a cached result.
+    """
+    return highlight_source(linenumber, index, lines)
+
+
 def cannot_analyze_stdin():
     """Typical case: friendly_traceback is imported in an ordinary Python
     interpreter (REPL), and the user does not activate the friendly
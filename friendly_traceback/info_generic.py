@@ -2,6 +2,8 @@
 
 Generic information about Python exceptions.
 """
+import functools
+
 from .my_gettext import current_lang
 
 GENERIC = {}
@@ -9,6 +11,14 @@ GENERIC = {}
 
 def get_generic_explanation(exception_name):
     """Provides a generic explanation about a particular exception."""
+    return _get_generic_explanation(exception_name, current_lang.lang)
+
+
+@functools.lru_cache(maxsize=128)
+def _get_generic_explanation(exception_name, lang):
+    """Cached version of get_generic_explanation. The explanation depends
+    on the language used, so that lang is part of the cache key.
+    """
     if exception_name in GENERIC:
         explanation = GENERIC[exception_name]()
     elif exception_name.endswith("Warning"):
@@ -5,6 +5,14 @@ of a given exception.
 """
 
 from .my_gettext import current_lang
+from .runtime_errors import (
+    attribute_error,
+    import_error,
+    module_not_found_error,
+    name_error,
+    type_error,
+    unbound_local_error,
+)
 
 get_cause = {}
 
@@ -14,9 +22,9 @@ def get_likely_cause(etype, value, info, frame):
     specific to a given exception.
     """
     _ = current_lang.translate
-    cause = None
-    if etype.__name__ in get_cause:
-        cause = get_cause[etype.__name__](value, info, frame)
+    handler = get_cause.get(etype.__name__)
+    if handler is not None:
+        cause = handler(value, info, frame)
         if cause is not None:
             info["cause_header"] = _(
                 "Likely cause based on the information given by Python:"
@@ -30,40 +38,34 @@ def register(error_name):
 
     def add_exception(function):
         get_cause[error_name] = function
-
-        def wrapper(value, info, frame):
-            return function(value, info, frame)
-
-        return wrapper
+        return function
 
     return add_exception
 
 
 @register("AttributeError")
 def _attribute_error(value, info, frame):
-    from .runtime_errors import attribute_error
-
     return attribute_error.get_cause(value, info, frame)
 
 
 @register("FileNotFoundError")
 def file_not_found_error(value, info, frame):
     _ = current_lang.translate
+    # The filename is normally available as an attribute. If it is not,
     # str(value) is expected to be something like
     #
-    # fileNotFoundError: No module named 'does_not_exist'
+    # FileNotFoundError: [Errno 2] No such file or directory: 'does_not_exist'
     #
-    # By splitting value using ', we can extract the module name.
+    # and by splitting value using ', we can extract the file name.
+    filename = getattr(value, "filename", None) or str(value).split("'")[1]
     return _(
         "In your program, the name of the\n"
         "file that cannot be found is `{filename}`.\n"
-    ).format(filename=str(value).split("'")[1])
+    ).format(filename=filename)
 
 
 @register("ImportError")
 def _import_error(value, info, frame):
-    from .runtime_errors import import_error
-
     return import_error.get_cause(value, info, frame)
 
 
@@ -80,17 +82,11 @@ def key_error(value, info, frame):
 
 @register("ModuleNotFoundError")
 def _module_not_found_error(value, info, frame):
-
-    from .runtime_errors import module_not_found_error
-
     return module_not_found_error.get_cause(value, info, frame)
 
 
 @register("NameError")
-def name_error(value, info, frame):
-
-    from .runtime_errors import name_error
-
+def _name_error(value, info, frame):
     return name_error.get_cause(value, info, frame)
 
 
@@ -102,15 +98,11 @@ def overflow_error(*args):
 
 @register("TypeError")
 def _type_error(value, info, frame):
-    from .runtime_errors import type_error
-
     return type_error.get_cause(value, info, frame)
 
 
 @register("UnboundLocalError")
 def _unbound_local_error(value, info, frame):
-    from .runtime_errors import unbound_local_error
-
     return unbound_local_error.get_cause(value, info, frame)
 
 
@@ -4,7 +4,7 @@ import sys
 import re
 
 from ..my_gettext import current_lang
-from ..utils import get_similar_words, tokenize_source
+from ..utils import get_similar_words, tokenize_source, tokenize_source_lines
 from ..path_info import path_utils
 from ..source_cache import cache
 from . import stdlib_modules
@@ -312,8 +312,7 @@ def find_true_object_name_and_position(obj, obj_name, attribute, info, frame):
     # So, let's try again with the complete source.
 
     source_lines = cache.get_source_lines(info["filename"])
-    source = "\n".join(source_lines)
-    tokens = tokenize_source(source)
+    tokens = tokenize_source_lines(source_lines)
     for index, tok in enumerate(tokens):
         try:
             candidate = eval(tok.string, frame.f_globals, frame.f_locals)
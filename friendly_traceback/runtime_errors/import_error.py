@@ -7,6 +7,24 @@ from ..my_gettext import current_lang
 from ..utils import get_similar_words
 from ..path_info import path_utils
 
+# Python 3.8+
+_CANNOT_IMPORT_FROM_PARTIAL = re.compile(
+    r"cannot import name '(.*)' from partially initialized module '(.*)'"
+)
+# Python 3.7+
+_CANNOT_IMPORT_FROM = re.compile(r"cannot import name '(.*)' from '(.*)'")
+# Python 3.6
+_CANNOT_IMPORT = re.compile(r"cannot import name '(.*)'")
+_FROM_IMPORT = re.compile(r"from (.*) import")
+
+# Lines of a traceback indicating either a file or an import statement
+_TRACEBACK_FILE_OR_IMPORT = re.compile(
+    r'^[ \t]*(?:File "(?P<file>.*)", line'
+    r"|from (?P<from>.*) import"
+    r"|import (?P<import>.*?)[ \t]*$)",
+    re.M,
+)
+
 
 def get_cause(value, info, frame):
     _ = current_lang.translate
@@ -14,10 +32,7 @@ def get_cause(value, info, frame):
     message = str(value)
 
     # Python 3.8+
-    pattern1 = re.compile(
-        r"cannot import name '(.*)' from partially initialized module '(.*)'"
-    )
-    match = re.search(pattern1, message)
+    match = _CANNOT_IMPORT_FROM_PARTIAL.search(message)
     if match:
         if "circular import" in message:
             return cannot_import_name_from(
@@ -26,14 +41,12 @@ def get_cause(value, info, frame):
         return cannot_import_name_from(match.group(1), match.group(2), info, frame)
 
     # Python 3.7+
-    pattern2 = re.compile(r"cannot import name '(.*)' from '(.*)'")
-    match = re.search(pattern2, message)
+    match = _CANNOT_IMPORT_FROM.search(message)
     if match:
         return cannot_import_name_from(match.group(1), match.group(2), info, frame)
 
     # Python 3.6
-    pattern3 = re.compile(r"cannot import name '(.*)'")
-    match = re.search(pattern3, message)
+    match = _CANNOT_IMPORT.search(message)
     if match:
         return cannot_import_name(match.group(1), info, frame)
 
@@ -89,8 +102,7 @@ def cannot_import_name_from(name, module, info, frame, add_circular_hint=True):
         ).format(correct=similar[0], typo=name, module=module)
     else:
         # transform ['a', 'b', 'c'] in "[`a`, `b`, `c`]"
-        candidates = ["{c}".format(c=c.replace("'", "")) for c in similar]
-        candidates = ", ".join(candidates)
+        candidates = ", ".join(c.replace("'", "") for c in similar)
         info["suggest"] = _("Did you mean one of the following: `{names}`?\n").format(
             names=candidates
         )
@@ -101,18 +113,11 @@ def cannot_import_name_from(name, module, info, frame, add_circular_hint=True):
             "`{candidates}`\n"
         ).format(candidates=candidates, typo=name, module=module)
 
-    return _(
-        "The object that could not be imported is `{name}`.\n"
-        "The module or package where it was \n"
-        "expected to be found is `{module}`.\n"
-    ).format(name=name, module=module)
-
 
 def cannot_import_name(name, info, frame):
     # Python 3.6 does not give us the name of the module
     _ = current_lang.translate
-    pattern = re.compile(r"from (.*) import")
-    match = re.search(pattern, info["bad_line"])
+    match = _FROM_IMPORT.search(info["bad_line"])
     if match:
         return cannot_import_name_from(name, match.group(1), info, frame)
 
@@ -122,48 +127,45 @@ def cannot_import_name(name, info, frame):
 def find_circular_import(name, info):
     """This attempts to find circular imports."""
     _ = current_lang.translate
-
-    pattern_file = re.compile(r'^File "(.*)", line', re.M)
-    pattern_from = re.compile(r"^from (.*) import", re.M)
-    pattern_import = re.compile(r"^import (.*)", re.M)
-    modules_imported = []
-    tb_lines = info["simulated_python_traceback"].split("\n")
+    # For each module, we record the first file in which it is imported;
+    # a circular import is found if the last module imported had
+    # already been imported before.
+    first_imported_in = {}
+    last_file = last_module = previous_file = None
     current_file = ""
-    for line in tb_lines:
-        line = line.strip()
-        match_file = re.search(pattern_file, line)
-        match_from = re.search(pattern_from, line)
-        match_import = re.search(pattern_import, line)
-
-        if match_file:
-            current_file = path_utils.shorten_path(match_file.group(1))
-        elif match_from or match_import:
-            if match_from:
-                modules_imported.append((current_file, match_from.group(1)))
+    tb = info["simulated_python_traceback"]
+    for match in _TRACEBACK_FILE_OR_IMPORT.finditer(tb):
+        if match.group("file") is not None:
+            current_file = path_utils.shorten_path(match.group("file"))
+        else:
+            if match.group("from") is not None:
+                modules = [match.group("from")]
             else:
-                module = match_import.group(1)
-                if "," in module:  # multiple modules imported on same line
-                    modules = module.split(",").replace("(", "").strip()
-                    for mod in modules:
-                        modules_imported.append((current_file, mod))
-                else:
-                    modules_imported.append((current_file, module))
+                # multiple modules can be imported on the same line
+                modules = [
+                    mod.replace("(", "").replace(")", "").strip()
+                    for mod in match.group("import").split(",")
+                ]
+            for module in modules:
+                last_file, last_module = current_file, module
+                previous_file = first_imported_in.get(module)
+                first_imported_in.setdefault(module, current_file)
             current_file = ""
 
-    last_file, last_module = modules_imported[-1]
-
-    for file, module in modules_imported[:-1]:
-        if module == last_module:
-            return _(
-                "The problem was likely caused by what is known as a 'circular import'.\n"
-                "First, Python imported and started executing the code in file\n"
-                "   '{file}'.\n"
-                "which imports module `{last_module}`.\n"
-                "During this process, the code in another file,\n"
-                "   '{last_file}'\n"
-                "was executed. However in this last file, an attempt was made\n"
-                "to import the original module `{last_module}`\n"
-                "a second time, before Python had completed the first import.\n"
-            ).format(
-                file=file, last_file=last_file, module=module, last_module=last_module
-            )
+    if previous_file is not None:
+        return _(
+            "The problem was likely caused by what is known as a 'circular import'.\n"
+            "First, Python imported and started executing the code in file\n"
+            "   '{file}'.\n"
+            "which imports module `{last_module}`.\n"
+            "During this process, the code in another file,\n"
+            "   '{last_file}'\n"
+            "was executed. However in this last file, an attempt was made\n"
+            "to import the original module `{last_module}`\n"
+            "a second time, before Python had completed the first import.\n"
+        ).format(
+            file=previous_file,
+            last_file=last_file,
+            module=last_module,
+            last_module=last_module,
+        )
@@ -15,6 +15,91 @@ from friendly_traceback.friendly_exception import FriendlyException
 
 
 MESSAGE_ANALYZERS = []
+_DISPATCH = {}  # trigger: list of analyzers
+
+# Python 3.8+
+_MISMATCHED_PAREN_WITH_LINE = re.compile(
+    r"closing parenthesis '(.)' does not match opening parenthesis '(.)' on line (\d+)"
+)
+_MISMATCHED_PAREN = re.compile(
+    r"closing parenthesis '(.)' does not match opening parenthesis '(.)'"
+)
+_NAME_IN_QUOTES = re.compile(r"'([^']+)'")
+_PYTHON2_PRINT = re.compile(
+    r"Missing parentheses in call to 'print'\. Did you mean print\((.*)\)\?"
+)
+
+# Messages given by Python when assigning to a keyword or a constant
+_ASSIGN_TO_KEYWORD = frozenset(
+    {
+        "can't assign to keyword",  # Python 3.6, 3.7
+        "assignment to keyword",  # Python 3.6, 3.7
+        "cannot assign to keyword",  # Python 3.8
+        "cannot assign to None",  # Python 3.8
+        "cannot assign to True",  # Python 3.8
+        "cannot assign to False",  # Python 3.8
+        "cannot assign to __debug__",  # Python 3.8
+        "can't assign to Ellipsis",  # Python 3.6, 3.7
+        "cannot assign to Ellipsis",  # Python 3.8
+        "cannot use named assignment with True",  # Python 3.8
+        "cannot use named assignment with False",  # Python 3.8
+        "cannot use named assignment with None",  # Python 3.8
+        "cannot use named assignment with Ellipsis",  # Python 3.8
+        "cannot use assignment expressions with True",  # Python 3.8
+        "cannot use assignment expressions with False",  # Python 3.8
+        "cannot use assignment expressions with None",  # Python 3.8
+        "cannot use assignment expressions with Ellipsis",  # Python 3.8
+    }
+)
+_CONSTANTS = frozenset({"None", "True", "False", "__debug__", "Ellipsis (...)"})
+_KEYWORDS = frozenset(kwlist) | {"__debug__"}
+
+_ASSIGN_TO_CONDITIONAL_EXPRESSION = frozenset(
+    {
+        "can't assign to conditional expression",  # Python 3.6, 3.7
+        "cannot assign to conditional expression",  # Python 3.8
+    }
+)
+
+_ASSIGN_TO_FUNCTION_CALL = frozenset(
+    {
+        "can't assign to function call",  # Python 3.6, 3.7
+        "cannot assign to function call",  # Python 3.8
+    }
+)
+
+_ASSIGN_TO_GENERATOR_EXPRESSION = frozenset(
+    {
+        "can't assign to generator expression",  # Python 3.6, 3.7
+        "cannot assign to generator expression",  # Python 3.8
+    }
+)
+
+_ASSIGN_TO_LITERAL = frozenset(
+    {
+        "can't assign to literal",  # Python 3.6, 3.7
+        "cannot assign to literal",  # Python 3.8
+        "cannot assign to set display",  # Python 3.8
+        "cannot assign to dict display",  # Python 3.8
+    }
+)
+
+_ASSIGN_TO_OPERATOR = frozenset(
+    {
+        "can't assign to operator",  # Python 3.6, 3.7
+        "cannot assign to operator",  # Python 3.8
+    }
+)
+
+_DELETE_FUNCTION_CALL = frozenset(
+    {
+        "can't delete function call",  # Python 3.6, 3.7
+        "cannot delete function call",  # Python 3.8
+    }
+)
+
+# Python 3.8
+_UNMATCHED_BRACKETS = {"unmatched ')'": ")", "unmatched ']'": "]", "unmatched '}'": "}"}
 
 # The following has been taken from https://unicode-table.com/en/sets/quotation-marks/
 bad_quotation_marks = [
@@ -47,7 +132,20 @@ bad_quotation_marks = [
 def analyze_message(
     message="", line="", linenumber=0, source_lines=None, offset=0, info=None
 ):
+    if not message:
+        return None
+
+    # Rather than calling every analyzer in turn, we only call those
+    # for which a trigger is found in the message; they are tried
+    # in the order in which they have been added.
+    candidates = set()
+    for trigger, analyzers in _DISPATCH.items():
+        if trigger in message:
+            candidates.update(analyzers)
+
     for case in MESSAGE_ANALYZERS:
+        if case not in candidates:
+            continue
         cause = case(
             message=message,
             line=line,
@@ -60,59 +158,49 @@ def analyze_message(
             return cause
 
 
-def add_python_message(func):
+def add_python_message(triggers):
     """A simple decorator that adds a function the the list of functions
     that process a message given by Python.
+
+    The function will only be called when at least one of the triggers
+    (substrings) is found in the message.
     """
-    MESSAGE_ANALYZERS.append(func)
 
-    def wrapper(**kwargs):
-        return func(**kwargs)
+    def register(func):
+        MESSAGE_ANALYZERS.append(func)
+        for trigger in triggers:
+            _DISPATCH.setdefault(trigger, []).append(func)
+        return func
+
+    return register
+
 
-    return wrapper
+def _quoted_name(message):
+    """Returns the first name found between single quotes in a message."""
+    match = _NAME_IN_QUOTES.search(message)
+    return match.group(1) if match else ""
 
 
-@add_python_message
+@add_python_message(triggers=["assign"])
 def assign_to_keyword(message="", line="", info=None, **kwargs):
     _ = current_lang.translate
-    if not (
-        message == "can't assign to keyword"  # Python 3.6, 3.7
-        or message == "assignment to keyword"  # Python 3.6, 3.7
-        or message == "cannot assign to keyword"  # Python 3.8
-        or message == "cannot assign to None"  # Python 3.8
-        or message == "cannot assign to True"  # Python 3.8
-        or message == "cannot assign to False"  # Python 3.8
-        or message == "cannot assign to __debug__"  # Python 3.8
-        or message == "can't assign to Ellipsis"  # Python 3.6, 3.7
-        or message == "cannot assign to Ellipsis"  # Python 3.8
-        or message == "cannot use named assignment with True"  # Python 3.8
-        or message == "cannot use named assignment with False"  # Python 3.8
-        or message == "cannot use named assignment with None"  # Python 3.8
-        or message == "cannot use named assignment with Ellipsis"  # Python 3.8
-        or message == "cannot use assignment expressions with True"  # Python 3.8
-        or message == "cannot use assignment expressions with False"  # Python 3.8
-        or message == "cannot use assignment expressions with None"  # Python 3.8
-        or message == "cannot use assignment expressions with Ellipsis"  # Python 3.8
-    ):
+    if message not in _ASSIGN_TO_KEYWORD:
         return
 
     if "Ellipsis" in message:
         word = "Ellipsis (...)"
     else:
-        tokens = utils.tokenize_source(line)
-        while True:
-            for token in tokens:
-                word = token.string
-                if word in kwlist or word == "__debug__":
-                    break
-            else:
-                raise FriendlyException("analyze_syntax.assign_to_keyword")
-            break
+        for token in utils.tokenize_source(line):
+            word = token.string
+            if word in _KEYWORDS:
+                break
+        else:
+            raise FriendlyException("analyze_syntax.assign_to_keyword")
 
     info["suggest"] = _("You cannot assign a value to `{keyword}`.").format(
         keyword=word
     )
-    if word in ["None", "True", "False", "__debug__", "Ellipsis (...)"]:
+    if word in _CONSTANTS:
         return _(
             "`{keyword}` is a constant in Python; you cannot assign it a value.\n" "\n"
         ).format(keyword=word)
@@ -124,13 +212,10 @@ def assign_to_keyword(message="", line="", info=None, **kwargs):
         ).format(keyword=word)
 
 
-@add_python_message
+@add_python_message(triggers=["assign to conditional expression"])
 def assign_to_conditional_expression(message="", **kwargs):
     _ = current_lang.translate
-    if (
-        message == "can't assign to conditional expression"  # Python 3.6, 3.7
-        or message == "cannot assign to conditional expression"  # Python 3.8
-    ):
+    if message in _ASSIGN_TO_CONDITIONAL_EXPRESSION:
         return _(
             "On the left-hand side of an equal sign, you have a\n"
             "conditional expression instead of the name of a variable.\n"
@@ -139,14 +224,12 @@ def assign_to_conditional_expression(message="", **kwargs):
         )
 
 
-@add_python_message
+@add_python_message(triggers=["assign to function call"])
 def assign_to_function_call(message="", line="", **kwargs):
     _ = current_lang.translate
-    if (
-        message == "can't assign to function call"  # Python 3.6, 3.7
-        or message == "cannot assign to function call"  # Python 3.8
-    ):
-        if line.count("=") > 1:
+    if message in _ASSIGN_TO_FUNCTION_CALL:
+        fn_call, _equal, value = line.partition("=")
+        if "=" in value:
             # we have something like  fn(a=1) = 2
             # or fn(a) = 1 = 2, etc.  Since there could be too many
             # combinations, we use some generic names
@@ -159,9 +242,8 @@ def assign_to_function_call(message="", line="", **kwargs):
                 "a function call and not the name of a variable.\n"
             ).format(fn_call=fn_call, value=value)
 
-        info = line.split("=")
-        fn_call = info[0].strip()
-        value = info[1].strip()
+        fn_call = fn_call.strip()
+        value = value.strip()
         return _(
             "You wrote the expression\n\n"
             "    {fn_call} = {value}\n\n"
@@ -170,13 +252,10 @@ def assign_to_function_call(message="", line="", **kwargs):
         ).format(fn_call=fn_call, value=value)
 
 
-@add_python_message
+@add_python_message(triggers=["assign to generator expression"])
 def assign_to_generator_expression(message="", **kwargs):
     _ = current_lang.translate
-    if (
-        message == "can't assign to generator expression"  # Python 3.6, 3.7
-        or message == "cannot assign to generator expression"  # Python 3.8
-    ):
+    if message in _ASSIGN_TO_GENERATOR_EXPRESSION:
         return _(
             "On the left-hand side of an equal sign, you have a\n"
             "generator expression instead of the name of a variable.\n"
@@ -211,7 +290,7 @@ def what_kind_of_literal(literal):
         return None
 
 
-@add_python_message
+@add_python_message(triggers=["cannot assign to f-string expression"])
 def assign_to_f_expression(message="", line="", **kwargs):
     _ = current_lang.translate
     if message == "cannot assign to f-string expression":
@@ -223,19 +302,21 @@ def assign_to_f_expression(message="", line="", **kwargs):
         )
 
 
-@add_python_message
+@add_python_message(
+    triggers=[
+        "assign to literal",
+        "cannot assign to set display",
+        "cannot assign to dict display",
+    ]
+)
 def assign_to_literal(message="", line="", **kwargs):
     _ = current_lang.translate
-    if (
-        message == "can't assign to literal"  # Python 3.6, 3.7
-        or message == "cannot assign to literal"  # Python 3.8
-        or message == "cannot assign to set display"  # Python 3.8
-        or message == "cannot assign to dict display"  # Python 3.8
-    ):
-        info = line.split("=")
-        if len(info) == 2:
-            literal = info[0].strip()
-            name = info[1].strip()
+    if message in _ASSIGN_TO_LITERAL:
+        literal, equal, name = line.partition("=")
+        single_assignment = bool(equal) and "=" not in name
+        if single_assignment:
+            literal = literal.strip()
+            name = name.strip()
             if sys.version_info < (3, 8) and (
                 literal.startswith("f'{") or literal.startswith('f"{')
             ):
@@ -249,7 +330,7 @@ def assign_to_literal(message="", line="", **kwargs):
             literal = None
             name = _("variable_name")
 
-        if len(info) == 2 and name.isidentifier():
+        if single_assignment and name.isidentifier():
             # fmt: off
             suggest = _(
                 " Perhaps you meant to write:\n\n"
@@ -285,13 +366,10 @@ def assign_to_literal(message="", line="", **kwargs):
         )
 
 
-@add_python_message
+@add_python_message(triggers=["assign to operator"])
 def assign_to_operator(message="", **kwargs):
     _ = current_lang.translate
-    if (
-        message == "can't assign to operator"  # Python 3.6, 3.7
-        or message == "cannot assign to operator"  # Python 3.8
-    ):
+    if message in _ASSIGN_TO_OPERATOR:
         return _(
             "You wrote an expression that includes some mathematical operations\n"
             "on the left-hand side of the equal sign which should be\n"
@@ -299,18 +377,18 @@ def assign_to_operator(message="", **kwargs):
         )
 
 
-@add_python_message
+@add_python_message(triggers=["is nonlocal and global"])
 def both_nonlocal_and_global(message="", line=None, **kwargs):
     _ = current_lang.translate
     if "is nonlocal and global" in message:
-        name = message.split("'")[1]
+        name = _quoted_name(message)
         return _(
             "You declared `{name}` as being both a global and nonlocal variable.\n"
             "A variable can be global, or nonlocal, but not both at the same time.\n"
         ).format(name=name)
 
 
-@add_python_message
+@add_python_message(triggers=["'break' outside loop"])
 def break_outside_loop(message="", **kwargs):
     _ = current_lang.translate
     if "'break' outside loop" in message:
@@ -320,7 +398,7 @@ def break_outside_loop(message="", **kwargs):
         )
 
 
-@add_python_message
+@add_python_message(triggers=["'continue' not properly in loop"])
 def continue_outside_loop(message="", **kwargs):
     _ = current_lang.translate
     if "'continue' not properly in loop" in message:
@@ -330,13 +408,10 @@ def continue_outside_loop(message="", **kwargs):
         )
 
 
-@add_python_message
+@add_python_message(triggers=["delete function call"])
 def delete_function_call(message="", line=None, **kwargs):
     _ = current_lang.translate
-    if (
-        message == "can't delete function call"  # Python 3.6, 3.7
-        or message == "cannot delete function call"  # Python 3.8
-    ):
+    if message in _DELETE_FUNCTION_CALL:
         tokens = utils.tokenize_source(line)
         if (
             tokens[0].string == "del"
@@ -356,11 +431,11 @@ def delete_function_call(message="", line=None, **kwargs):
         ).format(line=line, correct=correct)
 
 
-@add_python_message
+@add_python_message(triggers=["duplicate argument"])
 def duplicate_argument_in_function_definition(message="", line=None, **kwargs):
     _ = current_lang.translate
     if "duplicate argument" in message and "function definition" in message:
-        name = message.split("'")[1]
+        name = _quoted_name(message)
         return _(
             "You have defined a function repeating the keyword argument\n\n"
             "    {name}\n"
@@ -369,7 +444,7 @@ def duplicate_argument_in_function_definition(message="", line=None, **kwargs):
         ).format(name=name)
 
 
-@add_python_message
+@add_python_message(triggers=["EOL while scanning string literal"])
 def eol_while_scanning_string_literal(message="", **kwargs):
     _ = current_lang.translate
     if "EOL while scanning string literal" in message:
@@ -379,7 +454,7 @@ def eol_while_scanning_string_literal(message="", **kwargs):
         )
 
 
-@add_python_message
+@add_python_message(triggers=["expression cannot contain assignment"])
 def expression_cannot_contain_assignment(message="", **kwargs):
     _ = current_lang.translate
     if "expression cannot contain assignment, perhaps you meant" in message:
@@ -395,7 +470,7 @@ def expression_cannot_contain_assignment(message="", **kwargs):
         )
 
 
-@add_python_message
+@add_python_message(triggers=["Generator expression must be parenthesized"])
 def generator_expression_must_be_parenthesized(message="", **kwargs):
     _ = current_lang.translate
     if "Generator expression must be parenthesized" in message:
@@ -406,7 +481,7 @@ def generator_expression_must_be_parenthesized(message="", **kwargs):
         )
 
 
-@add_python_message
+@add_python_message(triggers=["keyword argument repeated"])
 def keyword_argument_repeated(message="", **kwargs):
     _ = current_lang.translate
     if "keyword argument repeated" in message:
@@ -416,7 +491,7 @@ def keyword_argument_repeated(message="", **kwargs):
         )
 
 
-@add_python_message
+@add_python_message(triggers=["keyword can't be an expression"])
 def keyword_cannot_be_expression(message="", **kwargs):
     _ = current_lang.translate
     if "keyword can't be an expression" in message:
@@ -430,7 +505,7 @@ def keyword_cannot_be_expression(message="", **kwargs):
         )
 
 
-@add_python_message
+@add_python_message(triggers=["invalid character"])
 def invalid_character_in_identifier(message="", line="", info=None, **kwargs):
     _ = current_lang.translate
     copy_paste = _("Did you use copy-paste?\n")
@@ -481,23 +556,17 @@ def invalid_character_in_identifier(message="", line="", info=None, **kwargs):
         )
 
 
-@add_python_message
+@add_python_message(triggers=["does not match opening parenthesis"])
 def mismatched_parenthesis(
     message="", source_lines=None, linenumber=None, offset=None, **kwargs
 ):
     # Python 3.8; something like:
     # closing parenthesis ']' does not match opening parenthesis '(' on line
     _ = current_lang.translate
-    pattern1 = re.compile(
-        r"closing parenthesis '(.)' does not match opening parenthesis '(.)' on line (\d+)"
-    )
-    match = re.search(pattern1, message)
+    match = _MISMATCHED_PAREN_WITH_LINE.search(message)
     if match is None:
         lineno = None
-        pattern2 = re.compile(
-            r"closing parenthesis '(.)' does not match opening parenthesis '(.)'"
-        )
-        match = re.search(pattern2, message)
+        match = _MISMATCHED_PAREN.search(message)
         if match is None:
             return
     else:
@@ -530,7 +599,7 @@ def mismatched_parenthesis(
     return response
 
 
-@add_python_message
+@add_python_message(triggers=["f-string: unterminated string"])
 def unterminated_f_string(message="", **kwargs):
     _ = current_lang.translate
     if "f-string: unterminated string" in message:
@@ -541,12 +610,12 @@ def unterminated_f_string(message="", **kwargs):
         )
 
 
-@add_python_message
+@add_python_message(triggers=["is parameter"])
 def name_is_parameter_and_global(message="", line="", **kwargs):
     # something like: name 'x' is parameter and global
     _ = current_lang.translate
     if "is parameter and global" in message:
-        name = message.split("'")[1]
+        name = _quoted_name(message)
         if name in line and "global" in line:
             newline = line
         else:
@@ -561,36 +630,36 @@ def name_is_parameter_and_global(message="", line="", **kwargs):
         ).format(newline=newline, name=name)
 
 
-@add_python_message
+@add_python_message(triggers=["declaration"])
 def name_assigned_to_prior_global(message="", **kwargs):
     # something like: name 'p' is assigned to before global declaration
     _ = current_lang.translate
     if "is assigned to before global declaration" in message:
-        name = message.split("'")[1]
+        name = _quoted_name(message)
         return _(
             "You assigned a value to the variable `{name}`\n"
             "before declaring it as a global variable.\n"
         ).format(name=name)
 
 
-@add_python_message
+@add_python_message(triggers=["declaration"])
 def name_used_prior_global(message="", **kwargs):
     # something like: name 'p' is used prior to global declaration
     _ = current_lang.translate
     if "is used prior to global declaration" in message:
-        name = message.split("'")[1]
+        name = _quoted_name(message)
         return _(
             "You used the variable `{name}`\n"
             "before declaring it as a global variable.\n"
         ).format(name=name)
 
 
-@add_python_message
+@add_python_message(triggers=["declaration"])
 def name_assigned_to_prior_nonlocal(message="", info=None, **kwargs):
     # something like: name 'p' is assigned to before global declaration
     _ = current_lang.translate
     if "is assigned to before nonlocal declaration" in message:
-        name = message.split("'")[1]
+        name = _quoted_name(message)
         info["suggest"] = _("Did you forget to add `nonlocal`?")
         return _(
             "You assigned a value to the variable `{name}`\n"
@@ -598,11 +667,11 @@ def name_assigned_to_prior_nonlocal(message="", info=None, **kwargs):
         ).format(name=name)
 
 
-@add_python_message
+@add_python_message(triggers=["is parameter"])
 def name_is_parameter_and_nonlocal(message="", **kwargs):
     _ = current_lang.translate
     if "is parameter and nonlocal" in message:
-        name = message.split("'")[1]
+        name = _quoted_name(message)
         return _(
             "You used `{name}` as a parameter for a function\n"
             "before declaring it also as a nonlocal variable:\n"
@@ -610,20 +679,20 @@ def name_is_parameter_and_nonlocal(message="", **kwargs):
         ).format(name=name)
 
 
-@add_python_message
+@add_python_message(triggers=["declaration"])
 def name_used_prior_nonlocal(message="", info=None, **kwargs):
     # something like: name 'q' is used prior to nonlocal declaration
     _ = current_lang.translate
     if "is used prior to nonlocal declaration" in message:
         info["suggest"] = _("Did you forget to write `nonlocal` first?")
-        name = message.split("'")[1]
+        name = _quoted_name(message)
         return _(
             "You used the variable `{name}`\n"
             "before declaring it as a nonlocal variable.\n"
         ).format(name=name)
 
 
-@add_python_message
+@add_python_message(triggers=["declaration"])
 def nonlocal_at_module_level(message="", **kwargs):
     _ = current_lang.translate
     if "nonlocal declaration not allowed at module level" in message:
@@ -634,18 +703,18 @@ def nonlocal_at_module_level(message="", **kwargs):
         )
 
 
-@add_python_message
+@add_python_message(triggers=["no binding for nonlocal"])
 def no_binding_for_nonlocal(message="", line=None, **kwargs):
     _ = current_lang.translate
     if "no binding for nonlocal" in message:
-        name = message.split("'")[1]
+        name = _quoted_name(message)
         return _(
             "You declared the variable `{name}` as being a\n"
             "nonlocal variable but it cannot be found.\n"
         ).format(name=name)
 
 
-@add_python_message
+@add_python_message(triggers=["unexpected character after line continuation character"])
 def unexpected_character_after_continuation(message="", **kwargs):
     _ = current_lang.translate
     if "unexpected character after line continuation character" in message:
@@ -657,7 +726,7 @@ def unexpected_character_after_continuation(message="", **kwargs):
         )
 
 
-@add_python_message
+@add_python_message(triggers=["unexpected EOF while parsing"])
 def unexpected_eof_while_parsing(
     message="", source_lines=None, linenumber=None, offset=None, **kwargs
 ):
@@ -683,24 +752,19 @@ def unexpected_eof_while_parsing(
     return response
 
 
-@add_python_message
+@add_python_message(triggers=["unmatched '"])
 def unmatched_parenthesis(message="", linenumber=None, **kwargs):
     _ = current_lang.translate
-    # Python 3.8
-    if message == "unmatched ')'":
-        bracket = source_analyzer.name_bracket(")")
-    elif message == "unmatched ']'":
-        bracket = source_analyzer.name_bracket("]")
-    elif message == "unmatched '}'":
-        bracket = source_analyzer.name_bracket("}")
-    else:
+    closing = _UNMATCHED_BRACKETS.get(message)
+    if closing is None:
         return
+    bracket = source_analyzer.name_bracket(closing)
     return _(
         "The closing {bracket} on line {linenumber} does not match anything.\n"
     ).format(bracket=bracket, linenumber=linenumber)
 
 
-@add_python_message
+@add_python_message(triggers=["positional argument follows keyword argument"])
 def position_argument_follows_keyword_arg(message="", **kwargs):
     _ = current_lang.translate
     if "positional argument follows keyword argument" not in message:
@@ -717,7 +781,7 @@ def position_argument_follows_keyword_arg(message="", **kwargs):
     )
 
 
-@add_python_message
+@add_python_message(triggers=["non-default argument follows default argument"])
 def non_default_arg_follows_default_arg(message="", **kwargs):
     _ = current_lang.translate
     if "non-default argument follows default argument" not in message:
@@ -734,23 +798,21 @@ def non_default_arg_follows_default_arg(message="", **kwargs):
     )
 
 
-@add_python_message
+@add_python_message(triggers=["Missing parentheses in call to 'print'"])
 def python2_print(message="", **kwargs):
     _ = current_lang.translate
-    if not message.startswith(
-        "Missing parentheses in call to 'print'. Did you mean print("
-    ):
+    match = _PYTHON2_PRINT.match(message)
+    if match is None:
         return
-    message = message[59:-2]
     return _(
         "Perhaps you need to type\n\n"
         "     print({message})\n\n"
         "In older version of Python, `print` was a keyword.\n"
         "Now, `print` is a function; you need to use parentheses to call it.\n"
-    ).format(message=message)
+    ).format(message=match.group(1))
 
 
-@add_python_message
+@add_python_message(triggers=["f-string: invalid syntax"])
 def fstring_invalid_syntax(message="", **kwargs):
     _ = current_lang.translate
     # Before Python 3.9, we'd simply get a generic "invalid syntax" message
@@ -197,9 +197,22 @@ def get_similar_words(word_with_typo, words):
         return []
     words = [word for word in words if len(word) > 1]
 
-    get = difflib.get_close_matches
     cutoff = min(0.8, 0.63 + 0.01 * len(word_with_typo))
-    result = get(word_with_typo, words, n=5, cutoff=cutoff)
+
+    def get(word, n):
+        # Two words whose lengths are too different cannot be a close
+        # match; this is the same upper bound as the one given by
+        # SequenceMatcher.real_quick_ratio(), but computed here it saves
+        # a set_seq1() and a real_quick_ratio() call per rejected candidate.
+        length = len(word)
+        candidates = [
+            w
+            for w in words
+            if 2.0 * min(length, len(w)) / (length + len(w)) >= cutoff
+        ]
+        return difflib.get_close_matches(word, candidates, n=n, cutoff=cutoff)
+
+    result = get(word_with_typo, n=5)
     if result:
         return result
 
@@ -207,9 +220,9 @@ def get_similar_words(word_with_typo, words):
     # typos based on wrong case like 'Pi' or 'PI' instead of 'pi'.
     # In the absence of results, we try
     # to see if the typos could have been caused by using the wrong case
-    result = get(word_with_typo.lower(), words, n=1, cutoff=cutoff)
+    result = get(word_with_typo.lower(), n=1)
     if result:
         return result
     else:
-        result = get(word_with_typo.upper(), words, n=1, cutoff=cutoff)
+        result = get(word_with_typo.upper(), n=1)
     return result
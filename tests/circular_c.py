@@ -0,0 +1,4 @@
+"""File used in for test_circular_import_multiple() in test_import_error.py"""
+import os, circular_d
+
+c = 1
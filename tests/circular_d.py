@@ -0,0 +1,2 @@
+"""File used in for test_circular_import_multiple() in test_import_error.py"""
+from circular_c import c
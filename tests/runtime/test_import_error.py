@@ -31,5 +31,20 @@ def test_circular_import():
     return result, message
 
 
+def test_circular_import_multiple():
+    try:
+        import circular_c
+    except Exception as e:
+        message = str(e)
+        friendly_traceback.explain_traceback(redirect="capture")
+    result = friendly_traceback.get_output()
+    assert not "debug_warning" in result, "Internal error found."
+    assert "ImportError" in result
+    if friendly_traceback.get_lang() == "en":
+        assert "what is known as a 'circular import'" in result
+
+    return result, message
+
+
 if __name__ == "__main__":
     print(test_import_error()[0])
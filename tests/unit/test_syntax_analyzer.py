@@ -48,7 +48,7 @@ _find_likely_cause() will proceed in three steps:
 """
 import sys
 from friendly_traceback import set_lang
-from friendly_traceback.syntax_errors import analyze_syntax
+from friendly_traceback.syntax_errors import analyze_syntax, message_analyzer
 
 def find(lines=[" "], linenumber=1, message="invalid syntax", offset=1):
     return analyze_syntax._find_likely_cause(
@@ -186,6 +186,201 @@ def test_equal_sign_instead_of_colon():
     )
 
 
+# Messages given by various Python versions, with a line of code that
+# could have produced them, and the function expected to analyze them.
+historic_messages = [
+    ("assign_to_keyword", "can't assign to keyword", "None = 1"),
+    ("assign_to_keyword", "assignment to keyword", "__debug__ = 1"),
+    ("assign_to_keyword", "cannot assign to keyword", "True = 1"),
+    ("assign_to_keyword", "cannot assign to None", "None = 1"),
+    ("assign_to_keyword", "cannot assign to True", "True = 1"),
+    ("assign_to_keyword", "cannot assign to False", "False = 1"),
+    ("assign_to_keyword", "cannot assign to __debug__", "__debug__ = 1"),
+    ("assign_to_keyword", "can't assign to Ellipsis", "... = 1"),
+    ("assign_to_keyword", "cannot assign to Ellipsis", "... = 1"),
+    ("assign_to_keyword", "cannot use named assignment with True", "(True := 1)"),
+    ("assign_to_keyword", "cannot use named assignment with None", "(None := 1)"),
+    (
+        "assign_to_keyword",
+        "cannot use assignment expressions with False",
+        "(False := 1)",
+    ),
+    (
+        "assign_to_conditional_expression",
+        "can't assign to conditional expression",
+        "a if b else c = 1",
+    ),
+    (
+        "assign_to_conditional_expression",
+        "cannot assign to conditional expression",
+        "a if b else c = 1",
+    ),
+    ("assign_to_function_call", "can't assign to function call", "f() = 1"),
+    ("assign_to_function_call", "cannot assign to function call", "f(a=1) = 2"),
+    (
+        "assign_to_generator_expression",
+        "can't assign to generator expression",
+        "(x for x in y) = 1",
+    ),
+    (
+        "assign_to_generator_expression",
+        "cannot assign to generator expression",
+        "(x for x in y) = 1",
+    ),
+    ("assign_to_f_expression", "cannot assign to f-string expression", "f'{x}' = 1"),
+    ("assign_to_literal", "can't assign to literal", "1 = a"),
+    ("assign_to_literal", "cannot assign to literal", "'a' = a"),
+    ("assign_to_literal", "cannot assign to set display", "{1} = a"),
+    ("assign_to_literal", "cannot assign to dict display", "{1: 2} = a"),
+    ("assign_to_operator", "can't assign to operator", "a + 1 = 2"),
+    ("assign_to_operator", "cannot assign to operator", "a + 1 = 2"),
+    ("both_nonlocal_and_global", "name 'x' is nonlocal and global", "nonlocal x"),
+    ("break_outside_loop", "'break' outside loop", "break"),
+    ("continue_outside_loop", "'continue' not properly in loop", "continue"),
+    ("delete_function_call", "can't delete function call", "del f()"),
+    ("delete_function_call", "cannot delete function call", "del f(a)"),
+    (
+        "duplicate_argument_in_function_definition",
+        "duplicate argument 'x' in function definition",
+        "def f(x, x): pass",
+    ),
+    (
+        "eol_while_scanning_string_literal",
+        "EOL while scanning string literal",
+        "a = 'b",
+    ),
+    (
+        "expression_cannot_contain_assignment",
+        'expression cannot contain assignment, perhaps you meant "=="?',
+        "f(1=2)",
+    ),
+    (
+        "generator_expression_must_be_parenthesized",
+        "Generator expression must be parenthesized",
+        "f(x for x in y, 1)",
+    ),
+    ("keyword_argument_repeated", "keyword argument repeated", "f(a=1, a=2)"),
+    (
+        "keyword_cannot_be_expression",
+        "keyword can't be an expression",
+        "f(1=2)",
+    ),
+    (
+        "invalid_character_in_identifier",
+        "invalid character in identifier",
+        "a = \u2018b\u2019",
+    ),
+    (
+        "mismatched_parenthesis",
+        "closing parenthesis ']' does not match opening parenthesis '(' on line 1",
+        "a = (1]",
+    ),
+    (
+        "mismatched_parenthesis",
+        "closing parenthesis ']' does not match opening parenthesis '('",
+        "a = (1]",
+    ),
+    (
+        "unterminated_f_string",
+        "f-string: unterminated string",
+        "f'{\"a}'",
+    ),
+    (
+        "name_is_parameter_and_global",
+        "name 'x' is parameter and global",
+        "global x",
+    ),
+    (
+        "name_assigned_to_prior_global",
+        "name 'x' is assigned to before global declaration",
+        "global x",
+    ),
+    (
+        "name_used_prior_global",
+        "name 'x' is used prior to global declaration",
+        "global x",
+    ),
+    (
+        "name_assigned_to_prior_nonlocal",
+        "name 'x' is assigned to before nonlocal declaration",
+        "nonlocal x",
+    ),
+    (
+        "name_is_parameter_and_nonlocal",
+        "name 'x' is parameter and nonlocal",
+        "nonlocal x",
+    ),
+    (
+        "name_used_prior_nonlocal",
+        "name 'x' is used prior to nonlocal declaration",
+        "nonlocal x",
+    ),
+    (
+        "nonlocal_at_module_level",
+        "nonlocal declaration not allowed at module level",
+        "nonlocal x",
+    ),
+    (
+        "no_binding_for_nonlocal",
+        "no binding for nonlocal 'x' found",
+        "nonlocal x",
+    ),
+    (
+        "unexpected_character_after_continuation",
+        "unexpected character after line continuation character",
+        "a = 1 \\ 2",
+    ),
+    ("unexpected_eof_while_parsing", "unexpected EOF while parsing", "a = (1,"),
+    ("unmatched_parenthesis", "unmatched ')'", "a = 1)"),
+    ("unmatched_parenthesis", "unmatched ']'", "a = 1]"),
+    ("unmatched_parenthesis", "unmatched '}'", "a = 1}"),
+    (
+        "position_argument_follows_keyword_arg",
+        "positional argument follows keyword argument",
+        "f(a=1, 2)",
+    ),
+    (
+        "non_default_arg_follows_default_arg",
+        "non-default argument follows default argument",
+        "def f(a=1, b): pass",
+    ),
+    (
+        "python2_print",
+        "Missing parentheses in call to 'print'. Did you mean print(\"hello\")?",
+        'print "hello"',
+    ),
+    ("fstring_invalid_syntax", "f-string: invalid syntax", "f'{1 1}'"),
+]
+
+
+def test_historic_messages():
+    # Each message must reach the analyzer meant for it through the
+    # triggers given to add_python_message, even if the current
+    # version of Python no longer produces it.
+    set_lang("en")
+    covered = set()
+    for name, message, line in historic_messages:
+        covered.add(name)
+        kwargs = dict(
+            message=message,
+            line=line,
+            linenumber=1,
+            source_lines=[line],
+            offset=1,
+        )
+        expected = getattr(message_analyzer, name)(info={}, **kwargs)
+        assert expected, (name, message)
+        assert message_analyzer.analyze_message(info={}, **kwargs) == expected, (
+            name,
+            message,
+        )
+
+    # Every analyzer must be covered by at least one message above.
+    assert covered == {
+        analyzer.__name__ for analyzer in message_analyzer.MESSAGE_ANALYZERS
+    }
+
+
 if __name__ == "__main__":
     import copy
 